@@ -14,9 +14,36 @@ Solution:
         Let S0 be the list with '0' appended to all numbers in S.
         Let S1 be the list with '1' appended to all numbers in S.
         Return the concatenation S0 and S1.
+
+    generate_binary_nums_iterative runs the same induction bottom-up, from the
+    base case to n, so it needs no recursion.
+
+    The induction lists the numbers in counting order, so the i-th string is
+    just i written in binary with n digits. generate_binary_nums_direct uses
+    this and fills string i from the bits of i. Each string starts as a copy
+    of n zeros and only its set bits are written, one per iteration.
+
+    generate_binary_nums_flat goes further and skips the per-string
+    allocations entirely. All 2^n numbers are written back to back into one
+    buffer of n * 2^n characters, with number i at offset i * n.
+
+    The same list is also the Cartesian product {0, 1}^n. Like an odometer,
+    generate_binary_nums_product steps from one number to the next by turning
+    the trailing 1s into 0s and the last 0 into a 1.
+
+    When n is known at compile time (up to MAX_TABLE_DIGITS),
+    binary_nums_table<N> computes all the digits during compilation.
+    generate_binary_nums_fixed<N> then only copies each row of that constant
+    table into its string, with no bit manipulation at run time.
+
+    for_each_binary_num streams the numbers to a callback, one by one, in the
+    same order. It keeps a single string of n digits alive, instead of the
+    2^n strings held by the functions that return a list.
 */
 
+#include <array>
 #include <cassert>
+#include <cstdint>
 #include <iostream>
 #include <string>
 #include <vector>
@@ -38,11 +65,130 @@ std::vector<std::string> generate_binary_nums(size_t n) {
   return res;
 }
 
+std::vector<std::string> generate_binary_nums_iterative(size_t n) {
+  std::vector<std::string> res = {""};
+
+  for (size_t i = 0; i < n; ++i) {
+    // Write both children of res[j] by index into next at 2j and 2j + 1.
+    // The "1" child takes over res[j]'s buffer, since res[j] is not needed
+    // any more.
+    std::vector<std::string> next(2 * res.size());
+    for (size_t j = 0; j < res.size(); ++j) {
+      next[2 * j] = res[j] + '0';
+      next[2 * j + 1] = std::move(res[j]) + '1';
+    }
+    res = std::move(next);
+  }
+
+  return res;
+}
+
+std::vector<std::string> generate_binary_nums_direct(size_t n) {
+  assert(n < 64 && "n must fit in the bits of a uint64_t");
+
+  const uint64_t count = uint64_t{1} << n;
+  // Every string starts as n zeros, so only the set bits need to be written
+  std::vector<std::string> res(count, std::string(n, '0'));
+  for (uint64_t i = 1; i < count; ++i) {
+    std::string& num = res[i];
+    for (uint64_t bits = i; bits != 0; bits &= bits - 1) {
+      // The most significant bit goes first
+      num[n - 1 - __builtin_ctzll(bits)] = '1';
+    }
+  }
+
+  return res;
+}
+
+std::string generate_binary_nums_flat(size_t n) {
+  assert(n < 64 && "n must fit in the bits of a uint64_t");
+
+  const uint64_t count = uint64_t{1} << n;
+  // The buffer starts as all zeros, so only the set bits need to be written
+  std::string res(n * count, '0');
+  char* row = res.data();
+  for (uint64_t i = 0; i < count; ++i, row += n) {
+    for (uint64_t bits = i; bits != 0; bits &= bits - 1) {
+      // The most significant bit goes first
+      row[n - 1 - __builtin_ctzll(bits)] = '1';
+    }
+  }
+
+  return res;
+}
+
+template <size_t N>
+using BinaryNumsTable = std::array<std::array<char, N>, (size_t{1} << N)>;
+
+// Compile-time evaluation has a step budget (clang's default is about a
+// million steps), so the table is built like an odometer: each row takes
+// amortized O(1) steps to derive from the previous one and is copied whole.
+constexpr size_t MAX_TABLE_DIGITS = 10;
+
+template <size_t N>
+constexpr BinaryNumsTable<N> binary_nums_table() {
+  static_assert(N <= MAX_TABLE_DIGITS, "the table has 2^N rows");
+
+  BinaryNumsTable<N> table{};
+  std::array<char, N> row{};
+  for (auto& digit : row) {
+    digit = '0';
+  }
+  table[0] = row;
+  for (size_t i = 1; i < table.size(); ++i) {
+    size_t k = N;
+    while (row[k - 1] == '1') {
+      row[--k] = '0';
+    }
+    row[k - 1] = '1';
+    table[i] = row;
+  }
+  return table;
+}
+
+template <size_t N>
+std::vector<std::string> generate_binary_nums_fixed() {
+  static constexpr auto table = binary_nums_table<N>();
+
+  std::vector<std::string> res;
+  res.reserve(table.size());
+  for (const auto& row : table) {
+    res.emplace_back(row.begin(), row.end());
+  }
+  return res;
+}
+
+// Visit is a template parameter so that the call to visit can be inlined
+template <typename Visit>
+void for_each_binary_num(size_t n, Visit&& visit) {
+  assert(n < 64 && "n must fit in the bits of a uint64_t");
+
+  const uint64_t count = uint64_t{1} << n;
+  std::string curr(n, '0');
+  visit(curr);
+  for (uint64_t i = 1; i < count; ++i) {
+    size_t k = n;
+    while (curr[k - 1] == '1') {
+      curr[--k] = '0';
+    }
+    curr[k - 1] = '1';
+    visit(curr);
+  }
+}
+
+std::vector<std::string> generate_binary_nums_product(size_t n) {
+  assert(n < 64 && "n must fit in the bits of a uint64_t");
+
+  std::vector<std::string> res;
+  res.reserve(uint64_t{1} << n);
+  for_each_binary_num(n, [&](const std::string& num) { res.push_back(num); });
+  return res;
+}
+
 void print_binary_nums(size_t n) {
-  std::vector<std::string> nums = generate_binary_nums(n);
-  for (const auto& num : nums) {
+  for_each_binary_num(n, [](const std::string& num) {
     std::cout << num << "\n";
-  }
+  });
   std::cout << "\n";
 }
 
@@ -77,11 +223,79 @@ void test_generate_binary_nums_3() {
   std::cout << "test_generate_binary_nums_3 passed\n";
 }
 
+void test_generate_binary_nums_iterative() {
+  for (size_t n = 0; n <= 10; ++n) {
+    assert(generate_binary_nums_iterative(n) == generate_binary_nums(n));
+  }
+  std::cout << "test_generate_binary_nums_iterative passed\n";
+}
+
+void test_generate_binary_nums_direct() {
+  for (size_t n = 0; n <= 10; ++n) {
+    assert(generate_binary_nums_direct(n) == generate_binary_nums(n));
+  }
+  std::cout << "test_generate_binary_nums_direct passed\n";
+}
+
+void test_generate_binary_nums_flat() {
+  assert(generate_binary_nums_flat(0).empty());
+  assert(generate_binary_nums_flat(2) == "00011011");
+
+  for (size_t n = 1; n <= 10; ++n) {
+    auto flat = generate_binary_nums_flat(n);
+    auto expected = generate_binary_nums(n);
+    assert(flat.size() == n * expected.size());
+    for (size_t i = 0; i < expected.size(); ++i) {
+      assert(flat.compare(i * n, n, expected[i]) == 0);
+    }
+  }
+  std::cout << "test_generate_binary_nums_flat passed\n";
+}
+
+void test_generate_binary_nums_fixed() {
+  // The table is built by the compiler
+  constexpr auto table = binary_nums_table<3>();
+  static_assert(table.size() == 8);
+  static_assert(table[5][0] == '1' && table[5][1] == '0' && table[5][2] == '1');
+
+  assert(generate_binary_nums_fixed<0>() == generate_binary_nums(0));
+  assert(generate_binary_nums_fixed<1>() == generate_binary_nums(1));
+  assert(generate_binary_nums_fixed<3>() == generate_binary_nums(3));
+  assert(generate_binary_nums_fixed<8>() == generate_binary_nums(8));
+  assert(generate_binary_nums_fixed<MAX_TABLE_DIGITS>() ==
+         generate_binary_nums(MAX_TABLE_DIGITS));
+  std::cout << "test_generate_binary_nums_fixed passed\n";
+}
+
+void test_generate_binary_nums_product() {
+  for (size_t n = 0; n <= 10; ++n) {
+    assert(generate_binary_nums_product(n) == generate_binary_nums(n));
+  }
+  std::cout << "test_generate_binary_nums_product passed\n";
+}
+
+void test_for_each_binary_num() {
+  for (size_t n = 0; n <= 10; ++n) {
+    std::vector<std::string> result;
+    for_each_binary_num(n, [&](const std::string& num) {
+      result.push_back(num);
+    });
+    assert(result == generate_binary_nums(n));
+  }
+  std::cout << "test_for_each_binary_num passed\n";
+}
+
 int main() {
   test_generate_binary_nums_0();
   test_generate_binary_nums_1();
   test_generate_binary_nums_2();
   test_generate_binary_nums_3();
+  test_generate_binary_nums_iterative();
+  test_generate_binary_nums_direct();
+  test_generate_binary_nums_flat();
+  test_generate_binary_nums_fixed();
+  test_generate_binary_nums_product();
+  test_for_each_binary_num();
 
   std::cout << "\nAll tests passed!\n";
   return 0;
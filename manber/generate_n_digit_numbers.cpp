@@ -0,0 +1,366 @@
+/*
+Problem:
+    Generate, in increasing order, all numbers of n digits that do not
+    contain the digit 0
+
+Solution:
+    Base case (n=1):
+        The digits 1 to 9
+
+    Induction hypothesis:
+        We know how to generate S, the list of all numbers of n-1 digits with
+        no zeros, in increasing order
+
+    Induction step:
+        Generate all numbers of n-1 digits with no zeros (using induction
+        hypothesis).
+        For each digit d from 1 to 9, prepend d to every number in S, that is,
+        d * 10^(n-1) + s.
+        Since d is the most significant digit and S is sorted, the result is
+        sorted too.
+
+    There are 9^n such numbers among the 9 * 10^(n-1) numbers of n digits.
+    generate_n_digit_numbers_no_zeros finds them directly: it scans
+    [10^(n-1), 10^n) in increasing order and keeps the numbers without a 0
+    digit.
+
+    for_each_n_digit_number_no_zeros streams the same numbers, in the same
+    order, to a callback. It only keeps the current prefix on the call stack,
+    so memory is O(n) instead of O(9^n).
+
+    filter_numbers_by_digit_sum sums the digits of a whole list together, two
+    digits per pass through TWO_DIGIT_SUMS. digit_sum_swar is a standalone
+    alternative for a single number: it adds eight digits at a time inside a
+    64-bit word. The filter does not use it.
+*/
+
+#include <array>
+#include <cassert>
+#include <charconv>
+#include <cstdint>
+#include <cstring>
+#include <iostream>
+#include <vector>
+
+// POW10[i] == 10^i, for every power of ten that fits in a uint64_t
+constexpr std::array<uint64_t, 20> POW10 = [] {
+  std::array<uint64_t, 20> powers{};
+  uint64_t power = 1;
+  for (size_t i = 0; i < powers.size(); ++i) {
+    powers[i] = power;
+    power *= 10;
+  }
+  return powers;
+}();
+
+// Whether no digit of num is 0; the number 0 is itself the digit 0
+bool has_no_zero(uint64_t num) {
+  if (num == 0) {
+    return false;
+  }
+  for (; num != 0; num /= 10) {
+    if (num % 10 == 0) {
+      return false;
+    }
+  }
+  return true;
+}
+
+std::vector<uint64_t> generate_n_digit_numbers_no_zeros_recursive(size_t n) {
+  assert(n >= 1 && n <= 19 && "n-digit numbers must fit in a uint64_t");
+
+  if (n == 1) {
+    return {1, 2, 3, 4, 5, 6, 7, 8, 9};
+  }
+
+  auto prev_numbers = generate_n_digit_numbers_no_zeros_recursive(n - 1);
+
+  const uint64_t base_num = POW10[n - 1];
+
+  std::vector<uint64_t> res;
+  res.reserve(9 * prev_numbers.size());
+  for (uint64_t digit = 1; digit <= 9; ++digit) {
+    for (const auto prev_num : prev_numbers) {
+      res.push_back(digit * base_num + prev_num);
+    }
+  }
+
+  return res;
+}
+
+std::vector<uint64_t> generate_n_digit_numbers_no_zeros(size_t n) {
+  assert(n >= 1 && n <= 19 && "n-digit numbers must fit in a uint64_t");
+
+  const uint64_t first = POW10[n - 1];
+  const uint64_t last = POW10[n] - 1;
+
+  std::vector<uint64_t> res;
+  for (uint64_t num = first;; ++num) {
+    if (has_no_zero(num)) {
+      res.push_back(num);
+    }
+    if (num == last) {
+      break;
+    }
+  }
+
+  return res;
+}
+
+// Digit sums of 0 to 99, so that digits can be consumed two at a time
+constexpr std::array<uint64_t, 100> TWO_DIGIT_SUMS = [] {
+  std::array<uint64_t, 100> sums{};
+  for (uint64_t i = 0; i < 100; ++i) {
+    sums[i] = i / 10 + i % 10;
+  }
+  return sums;
+}();
+
+/*
+Sum the digits of num without a loop over the digits.
+
+The decimal digits are written as ASCII into a buffer padded with '0', which
+is then read back as three 64-bit words holding eight digits each (SWAR, SIMD
+within a register). Subtracting 0x30 from every byte turns each character into
+its digit. Multiplying by 0x0101010101010101 adds all eight bytes into the top
+byte. No byte or partial sum can overflow, because 8 * 9 < 256. The position
+of the digits in the buffer does not matter, so the padding needs no
+alignment.
+*/
+uint64_t digit_sum_swar(uint64_t num) {
+  constexpr uint64_t ASCII_ZEROS = 0x3030303030303030ULL;
+  constexpr uint64_t ONES = 0x0101010101010101ULL;
+
+  // A uint64_t has at most 20 decimal digits
+  char buf[3 * sizeof(uint64_t)];
+  std::memset(buf, '0', sizeof(buf));
+  std::to_chars(buf, buf + sizeof(buf), num);
+
+  uint64_t sum = 0;
+  for (size_t offset = 0; offset < sizeof(buf); offset += sizeof(uint64_t)) {
+    uint64_t word;
+    std::memcpy(&word, buf + offset, sizeof(word));
+    sum += ((word - ASCII_ZEROS) * ONES) >> 56;
+  }
+  return sum;
+}
+
+/*
+Keep only the numbers whose digits add up to k.
+
+Rather than looping over the digits of one number at a time, the digit sums of
+all numbers are computed together, two digit positions per pass by looking up
+the sum of the lowest two digits in TWO_DIGIT_SUMS. Each pass is a branch-free
+loop over contiguous arrays, and the number of passes is half the number of
+digits of the largest number.
+*/
+std::vector<uint64_t> filter_numbers_by_digit_sum(
+    const std::vector<uint64_t>& numbers, uint64_t k) {
+  std::vector<uint64_t> digit_sums(numbers.size(), 0);
+  std::vector<uint64_t> rest(numbers);
+
+  bool any_left = !rest.empty();
+  while (any_left) {
+    any_left = false;
+    for (size_t i = 0; i < rest.size(); ++i) {
+      digit_sums[i] += TWO_DIGIT_SUMS[rest[i] % 100];
+      rest[i] /= 100;
+      any_left |= (rest[i] != 0);
+    }
+  }
+
+  std::vector<uint64_t> res;
+  for (size_t i = 0; i < numbers.size(); ++i) {
+    if (digit_sums[i] == k) {
+      res.push_back(numbers[i]);
+    }
+  }
+
+  return res;
+}
+
+/*
+Choose the digits from the most significant one, keeping track of how much of
+k is left for the remaining positions. Every remaining digit adds between 1
+and 9, so a prefix is abandoned as soon as the rest of the sum is out of that
+range. Only prefixes of valid numbers are ever extended, so the 9^n
+candidates are never built, and digits are tried in increasing order so the
+numbers come out sorted.
+*/
+void extend_numbers_summing_to_k(uint64_t prefix, size_t remaining_digits,
+                                 uint64_t remaining_sum,
+                                 std::vector<uint64_t>& res) {
+  if (remaining_digits == 0) {
+    res.push_back(prefix);
+    return;
+  }
+
+  for (uint64_t digit = 1; digit <= 9 && digit <= remaining_sum; ++digit) {
+    uint64_t rest = remaining_sum - digit;
+    if (rest < remaining_digits - 1 || rest > 9 * (remaining_digits - 1)) {
+      continue;
+    }
+    extend_numbers_summing_to_k(prefix * 10 + digit, remaining_digits - 1, rest,
+                                res);
+  }
+}
+
+std::vector<uint64_t> generate_n_digit_numbers_summing_to_k(size_t n,
+                                                            uint64_t k) {
+  assert(n >= 1 && n <= 19 && "n-digit numbers must fit in a uint64_t");
+
+  std::vector<uint64_t> res;
+  if (k >= n && k <= 9 * n) {
+    extend_numbers_summing_to_k(0, n, k, res);
+  }
+  return res;
+}
+
+template <typename Visit>
+void extend_n_digit_numbers_no_zeros(uint64_t prefix, size_t remaining_digits,
+                                     Visit& visit) {
+  if (remaining_digits == 0) {
+    visit(prefix);
+    return;
+  }
+
+  for (uint64_t digit = 1; digit <= 9; ++digit) {
+    extend_n_digit_numbers_no_zeros(prefix * 10 + digit, remaining_digits - 1,
+                                    visit);
+  }
+}
+
+// Visit is a template parameter so that the call to visit can be inlined
+template <typename Visit>
+void for_each_n_digit_number_no_zeros(size_t n, Visit&& visit) {
+  assert(n >= 1 && n <= 19 && "n-digit numbers must fit in a uint64_t");
+
+  extend_n_digit_numbers_no_zeros(0, n, visit);
+}
+
+void print_n_digit_numbers(size_t n) {
+  for_each_n_digit_number_no_zeros(n, [](uint64_t num) {
+    std::cout << num << "\n";
+  });
+  std::cout << "\n";
+}
+
+// Tests
+
+void test_generate_n_digit_numbers_1() {
+  auto result = generate_n_digit_numbers_no_zeros_recursive(1);
+  std::vector<uint64_t> expected = {1, 2, 3, 4, 5, 6, 7, 8, 9};
+  assert(result == expected);
+  std::cout << "test_generate_n_digit_numbers_1 passed\n";
+}
+
+void test_has_no_zero() {
+  assert(!has_no_zero(0));
+  assert(has_no_zero(7));
+  assert(has_no_zero(123456789));
+  assert(!has_no_zero(10));
+  assert(!has_no_zero(101));
+  assert(!has_no_zero(1000000000000000000));
+  std::cout << "test_has_no_zero passed\n";
+}
+
+void test_generate_n_digit_numbers_recursive() {
+  for (size_t n = 1; n <= 5; ++n) {
+    auto result = generate_n_digit_numbers_no_zeros_recursive(n);
+
+    // There are 9 choices for each of the n digits
+    size_t expected_count = 1;
+    for (size_t i = 0; i < n; ++i) {
+      expected_count *= 9;
+    }
+    assert(result.size() == expected_count);
+
+    for (size_t i = 0; i < result.size(); ++i) {
+      auto num = result[i];
+      assert(num >= POW10[n - 1] && num < POW10[n]);
+      assert(has_no_zero(num));
+      if (i > 0) {
+        assert(result[i - 1] < num);
+      }
+    }
+  }
+  std::cout << "test_generate_n_digit_numbers_recursive passed\n";
+}
+
+void test_generate_n_digit_numbers_no_zeros() {
+  for (size_t n = 1; n <= 5; ++n) {
+    assert(generate_n_digit_numbers_no_zeros(n) ==
+           generate_n_digit_numbers_no_zeros_recursive(n));
+  }
+  std::cout << "test_generate_n_digit_numbers_no_zeros passed\n";
+}
+
+void test_for_each_n_digit_number_no_zeros() {
+  for (size_t n = 1; n <= 5; ++n) {
+    std::vector<uint64_t> result;
+    for_each_n_digit_number_no_zeros(n, [&](uint64_t num) {
+      result.push_back(num);
+    });
+    assert(result == generate_n_digit_numbers_no_zeros_recursive(n));
+  }
+  std::cout << "test_for_each_n_digit_number_no_zeros passed\n";
+}
+
+void test_digit_sum_swar() {
+  for (uint64_t num = 0; num <= 100000; ++num) {
+    uint64_t expected = 0;
+    for (uint64_t rest = num; rest != 0; rest /= 10) {
+      expected += rest % 10;
+    }
+    assert(digit_sum_swar(num) == expected);
+  }
+  assert(digit_sum_swar(99999999) == 72);
+  assert(digit_sum_swar(9999999999999999999ULL) == 171);
+  assert(digit_sum_swar(18446744073709551615ULL) == 87);
+  std::cout << "test_digit_sum_swar passed\n";
+}
+
+void test_filter_numbers_by_digit_sum() {
+  std::vector<uint64_t> numbers = {0, 5, 14, 23, 41, 50, 99, 104, 11111};
+  std::vector<uint64_t> expected = {5, 14, 23, 41, 50, 104, 11111};
+  assert(filter_numbers_by_digit_sum(numbers, 5) == expected);
+  assert(filter_numbers_by_digit_sum(numbers, 18) ==
+         std::vector<uint64_t>{99});
+  assert(filter_numbers_by_digit_sum({}, 5).empty());
+  std::cout << "test_filter_numbers_by_digit_sum passed\n";
+}
+
+void test_generate_n_digit_numbers_summing_to_k() {
+  std::vector<uint64_t> expected = {13, 22, 31};
+  assert(generate_n_digit_numbers_summing_to_k(2, 4) == expected);
+
+  // The smallest digit sum is n and the largest is 9 * n
+  assert(generate_n_digit_numbers_summing_to_k(3, 2).empty());
+  assert(generate_n_digit_numbers_summing_to_k(3, 3) ==
+         std::vector<uint64_t>{111});
+  assert(generate_n_digit_numbers_summing_to_k(3, 27) ==
+         std::vector<uint64_t>{999});
+
+  for (size_t n = 1; n <= 5; ++n) {
+    auto numbers = generate_n_digit_numbers_no_zeros(n);
+    for (uint64_t k = 0; k <= 9 * n + 1; ++k) {
+      assert(generate_n_digit_numbers_summing_to_k(n, k) ==
+             filter_numbers_by_digit_sum(numbers, k));
+    }
+  }
+  std::cout << "test_generate_n_digit_numbers_summing_to_k passed\n";
+}
+
+int main() {
+  test_generate_n_digit_numbers_1();
+  test_has_no_zero();
+  test_generate_n_digit_numbers_recursive();
+  test_generate_n_digit_numbers_no_zeros();
+  test_for_each_n_digit_number_no_zeros();
+  test_digit_sum_swar();
+  test_filter_numbers_by_digit_sum();
+  test_generate_n_digit_numbers_summing_to_k();
+
+  std::cout << "\nAll tests passed!\n";
+  return 0;
+}
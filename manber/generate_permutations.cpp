@@ -17,12 +17,43 @@ character
         For each permutation, interpolate the removed character at every
         possible position.
         Return the concatenation of all these interpolated results.
+
+    generate_permutations_stl sorts the word and then steps through
+    lexicographic order with std::next_permutation, which rearranges a single
+    string from one permutation to the next. Because std::next_permutation
+    skips equal arrangements, a word with repeated characters yields each
+    distinct permutation only once.
+
+    generate_permutations_heap uses Heap's algorithm, iteratively. Each
+    permutation differs from the previous one by a single swap, so producing
+    the next one is O(1) work on one mutable string.
+
+    generate_permutations_lehmer numbers the permutations from 0 to n! - 1.
+    The digits of a number in the factorial number system (its Lehmer code)
+    say which of the remaining characters comes next, so nth_permutation can
+    decode any rank on its own. The generator fills a preallocated output by
+    index and counts through the Lehmer codes instead of dividing each rank.
+
+    generate_permutations_parallel splits the work by the first character.
+    The permutations starting with word[i] are word[i] followed by a
+    permutation of the other n - 1 characters. That makes n independent blocks
+    of (n - 1)! permutations each, which are spread over the hardware threads.
+
+    for_each_permutation follows the same induction as generate_permutations
+    but streams each permutation to a callback as soon as it is built. Each
+    level of the recursion keeps a single buffer, so memory is O(n^2) instead
+    of O(n * n!).
 */
 
+#include <algorithm>
 #include <cassert>
+#include <cstdint>
+#include <functional>
 #include <iostream>
+#include <iterator>
 #include <set>
 #include <string>
+#include <thread>
 #include <vector>
 
 /*
@@ -42,11 +73,19 @@ For example, with word = "ab" (length 2), we need 3 positions:
 std::vector<std::string> interpolate(char ch, const std::string& word) {
   std::vector<std::string> res;
   res.reserve(word.length() + 1);
-  for (size_t i = 0; i <= word.length(); ++i) {
-    // word.substr(0, i) will be empty when i == 0
-    // word.substr(i) will be empty when i == word.length()
-    auto interpolation = word.substr(0, i) + ch + word.substr(i);
-    res.push_back(interpolation);
+
+  // Start with ch in front of word, then slide ch one position to the right
+  // at a time. Moving from position i - 1 to i only changes two characters:
+  // word[i - 1] takes ch's old place and ch lands at i.
+  std::string buf;
+  buf.reserve(word.length() + 1);
+  buf.push_back(ch);
+  buf.append(word);
+  res.push_back(buf);
+  for (size_t i = 1; i <= word.length(); ++i) {
+    buf[i - 1] = word[i - 1];
+    buf[i] = ch;
+    res.push_back(buf);
   }
   return res;
 }
@@ -64,12 +103,210 @@ std::vector<std::string> generate_permutations(const std::string& word,
   auto perms = generate_permutations(smaller_word, pos - 1);
 
   std::vector<std::string> res;
+  res.reserve(perms.size() * (pos + 1));
 
   // Interpolate ch back into every position of every permutation of the word
   char ch = word[pos];
   for (const auto& perm : perms) {
     auto interpolations = interpolate(ch, perm);
-    res.insert(res.end(), interpolations.begin(), interpolations.end());
+    res.insert(res.end(), std::make_move_iterator(interpolations.begin()),
+               std::make_move_iterator(interpolations.end()));
+  }
+
+  return res;
+}
+
+std::vector<std::string> generate_permutations_stl(const std::string& word) {
+  std::string perm = word;
+  std::sort(perm.begin(), perm.end());
+
+  std::vector<std::string> res;
+  do {
+    res.push_back(perm);
+  } while (std::next_permutation(perm.begin(), perm.end()));
+
+  return res;
+}
+
+std::vector<std::string> generate_permutations_heap(const std::string& word) {
+  std::string perm = word;
+  size_t n = perm.length();
+
+  // c[i] counts the swaps already made at level i, simulating the recursion
+  std::vector<size_t> c(n, 0);
+
+  std::vector<std::string> res;
+  res.push_back(perm);
+
+  size_t i = 0;
+  while (i < n) {
+    if (c[i] < i) {
+      size_t j = (i % 2 == 0) ? 0 : c[i];
+      std::swap(perm[j], perm[i]);
+      res.push_back(perm);
+      ++c[i];
+      i = 0;
+    } else {
+      c[i] = 0;
+      ++i;
+    }
+  }
+
+  return res;
+}
+
+/*
+Write into perm, which must already have word's length, the permutation of
+word whose Lehmer code is digits: digits[i], between 0 and n - 1 - i, picks the
+next character among the ones not used yet. The unused positions are the set
+bits of a mask, so picking one only clears bits instead of erasing from a
+string.
+*/
+void decode_permutation(const std::string& word,
+                        const std::vector<uint8_t>& digits, std::string& perm) {
+  uint32_t unused = (uint32_t{1} << word.length()) - 1;
+  for (size_t i = 0; i < word.length(); ++i) {
+    // Drop the lowest digits[i] unused positions to reach the one to pick
+    uint32_t bits = unused;
+    for (uint8_t d = 0; d < digits[i]; ++d) {
+      bits &= bits - 1;
+    }
+    uint32_t pos = __builtin_ctz(bits);
+    unused &= ~(uint32_t{1} << pos);
+    perm[i] = word[pos];
+  }
+}
+
+/*
+Return the permutation of word with lexicographic rank k, where the ranks are
+taken over the positions of the characters in word. The i-th digit of k in
+the factorial number system is k / (n - 1 - i)! modulo (n - i).
+*/
+std::string nth_permutation(const std::string& word, uint64_t k) {
+  size_t n = word.length();
+  assert(n <= 20 && "n! must fit in a uint64_t");
+
+  std::vector<uint8_t> digits(n);
+  for (size_t i = n; i > 0; --i) {
+    // Peel off the digits from the least significant one, whose radix is 1
+    size_t radix = n - i + 1;
+    digits[i - 1] = static_cast<uint8_t>(k % radix);
+    k /= radix;
+  }
+  assert(k == 0 && "k must be smaller than n!");
+
+  std::string perm(n, '\0');
+  decode_permutation(word, digits, perm);
+  return perm;
+}
+
+std::vector<std::string> generate_permutations_lehmer(
+    const std::string& word) {
+  size_t n = word.length();
+  assert(n <= 20 && "n! must fit in a uint64_t");
+
+  uint64_t count = 1;
+  for (size_t i = 2; i <= n; ++i) {
+    count *= i;
+  }
+
+  // Going through the ranks in order, the Lehmer code is a mixed-radix
+  // counter, so it is incremented instead of being divided out of each rank
+  std::vector<uint8_t> digits(n, 0);
+  std::vector<std::string> res(count, std::string(n, '\0'));
+  for (uint64_t k = 0; k < count; ++k) {
+    decode_permutation(word, digits, res[k]);
+    for (size_t i = n; i > 0; --i) {
+      if (++digits[i - 1] < n - i + 1) {
+        break;
+      }
+      digits[i - 1] = 0;
+    }
+  }
+  return res;
+}
+
+// visit is a std::function rather than a template parameter because every
+// level wraps it in a new lambda, which would instantiate a new template per
+// level of the recursion
+void for_each_permutation(
+    const std::string& word, size_t pos,
+    const std::function<void(const std::string&)>& visit) {
+  if (pos == 0) {
+    visit(word);
+    return;
+  }
+
+  std::string smaller_word = word.substr(0, pos) + word.substr(pos + 1);
+  char ch = word[pos];
+
+  // Same sliding buffer as interpolate, but each result is handed to visit
+  // instead of being collected
+  std::string buf;
+  for_each_permutation(smaller_word, pos - 1, [&](const std::string& perm) {
+    buf.assign(1, ch);
+    buf.append(perm);
+    visit(buf);
+    for (size_t i = 1; i <= perm.length(); ++i) {
+      buf[i - 1] = perm[i - 1];
+      buf[i] = ch;
+      visit(buf);
+    }
+  });
+}
+
+std::vector<std::string> generate_permutations_parallel(
+    const std::string& word) {
+  size_t n = word.length();
+  if (n <= 1) {
+    return {word};
+  }
+
+  uint64_t block_size = 1;
+  for (size_t i = 2; i < n; ++i) {
+    block_size *= i;
+  }
+
+  std::vector<std::string> res(n * block_size);
+
+  // Each block is written by exactly one thread, so no locking is needed.
+  // The permutations of the rest are streamed straight into the block, so
+  // they are never collected in a list of their own.
+  auto fill_block = [&](size_t i) {
+    std::string rest = word.substr(0, i) + word.substr(i + 1);
+    size_t j = i * block_size;
+    for_each_permutation(rest, n - 2, [&](const std::string& perm) {
+      std::string& out = res[j++];
+      out.reserve(n);
+      out.push_back(word[i]);
+      out.append(perm);
+    });
+  };
+
+  // Below this size, starting the threads costs more than the work itself.
+  // The blocks are still filled the same way, so the layout does not depend
+  // on the length of the word.
+  constexpr size_t MIN_PARALLEL_LENGTH = 8;
+  if (n < MIN_PARALLEL_LENGTH) {
+    for (size_t i = 0; i < n; ++i) {
+      fill_block(i);
+    }
+    return res;
+  }
+
+  size_t num_threads = std::max<size_t>(
+      1, std::min<size_t>(n, std::thread::hardware_concurrency()));
+  std::vector<std::thread> threads;
+  threads.reserve(num_threads);
+  for (size_t t = 0; t < num_threads; ++t) {
+    threads.emplace_back([&, t] {
+      for (size_t i = t; i < n; i += num_threads) {
+        fill_block(i);
+      }
+    });
+  }
+  for (auto& thread : threads) {
+    thread.join();
   }
 
   return res;
@@ -80,10 +317,9 @@ void print_permutations(const std::string& word) {
     return;
   }
 
-  auto perms = generate_permutations(word, word.length() - 1);
-  for (const auto& perm : perms) {
+  for_each_permutation(word, word.length() - 1, [](const std::string& perm) {
     std::cout << perm << "\n";
-  }
+  });
   std::cout << "\n";
 }
 
@@ -139,12 +375,94 @@ void test_interpolate() {
   std::cout << "test_interpolate passed\n";
 }
 
+void test_generate_permutations_stl() {
+  std::vector<std::string> expected = {"ABC", "ACB", "BAC",
+                                       "BCA", "CAB", "CBA"};
+  assert(generate_permutations_stl("CAB") == expected);
+
+  auto result = generate_permutations_stl("ABCDE");
+  auto perms = generate_permutations("ABCDE", 4);
+  std::sort(perms.begin(), perms.end());
+  assert(result == perms);
+  std::cout << "test_generate_permutations_stl passed\n";
+}
+
+void test_generate_permutations_heap() {
+  std::vector<std::string> expected = {"ABC", "BAC", "CAB",
+                                       "ACB", "BCA", "CBA"};
+  assert(generate_permutations_heap("ABC") == expected);
+
+  auto result = generate_permutations_heap("ABCDE");
+  std::sort(result.begin(), result.end());
+  assert(result == generate_permutations_stl("ABCDE"));
+  std::cout << "test_generate_permutations_heap passed\n";
+}
+
+void test_nth_permutation() {
+  assert(nth_permutation("", 0) == "");
+  assert(nth_permutation("ABCD", 0) == "ABCD");
+  assert(nth_permutation("ABCD", 23) == "DCBA");
+  // 9 = 1 * 3! + 1 * 2! + 1 * 1!
+  assert(nth_permutation("ABCD", 9) == "BCDA");
+  std::cout << "test_nth_permutation passed\n";
+}
+
+void test_generate_permutations_lehmer() {
+  assert(generate_permutations_lehmer("ABCDE") ==
+         generate_permutations_stl("ABCDE"));
+
+  // The ranks follow the positions of the characters, not their values
+  std::vector<std::string> expected = {"CAB", "CBA", "ACB",
+                                       "ABC", "BCA", "BAC"};
+  assert(generate_permutations_lehmer("CAB") == expected);
+  std::cout << "test_generate_permutations_lehmer passed\n";
+}
+
+void test_generate_permutations_parallel() {
+  assert(generate_permutations_parallel("") == std::vector<std::string>{""});
+  assert(generate_permutations_parallel("A") ==
+         std::vector<std::string>{"A"});
+
+  // Short words take the sequential path, with the same block layout
+  std::vector<std::string> expected = {"ACB", "ABC", "BCA",
+                                       "BAC", "CBA", "CAB"};
+  assert(generate_permutations_parallel("ABC") == expected);
+
+  auto result = generate_permutations_parallel("ABCDEFGH");
+  assert(result.size() == 40320);
+  for (size_t i = 0; i < result.size(); ++i) {
+    // Blocks are laid out in the order of their first character
+    assert(result[i][0] == "ABCDEFGH"[i / 5040]);
+  }
+  std::sort(result.begin(), result.end());
+  assert(result == generate_permutations_stl("ABCDEFGH"));
+  std::cout << "test_generate_permutations_parallel passed\n";
+}
+
+void test_for_each_permutation() {
+  for (const std::string word : {"A", "AB", "ABC", "ABCDE"}) {
+    std::vector<std::string> result;
+    for_each_permutation(word, word.length() - 1,
+                         [&](const std::string& perm) {
+                           result.push_back(perm);
+                         });
+    assert(result == generate_permutations(word, word.length() - 1));
+  }
+  std::cout << "test_for_each_permutation passed\n";
+}
+
 int main() {
   test_generate_permutations_a();
   test_generate_permutations_ab();
   test_generate_permutations_abc();
   test_generate_permutations_abcd();
   test_interpolate();
+  test_generate_permutations_stl();
+  test_generate_permutations_heap();
+  test_nth_permutation();
+  test_generate_permutations_lehmer();
+  test_generate_permutations_parallel();
+  test_for_each_permutation();
 
   std::cout << "\nAll tests passed!\n";
   return 0;